@@ -0,0 +1,76 @@
+"""
+conftest.py
+
+Shared pytest hooks for the Swag Labs UI tests in test_saucedemo.py.
+
+When a test fails, a screenshot of the browser is taken from its `driver` fixture.
+Passing tests are not screenshotted.
+
+Screenshots are written by a background thread so the failing test isn't blocked on file I/O.
+They are appended to one uncompressed `screenshots_<pid>.zip` archive per pytest process
+(one per worker under pytest-xdist) instead of being created as separate files.
+The archive is only created once the first screenshot is taken.
+"""
+
+import os
+import queue
+import sys
+import threading
+import time
+import zipfile
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+
+# (name, png_bytes) pairs waiting to be written to _ZIP
+_SCREENSHOT_QUEUE = queue.Queue()
+_ZIP = None
+
+
+def _screenshot_writer():
+    global _ZIP
+    while True:
+        name, png = _SCREENSHOT_QUEUE.get()
+        try:
+            if _ZIP is None:
+                _ZIP = zipfile.ZipFile(f"screenshots_{os.getpid()}.zip", "w", zipfile.ZIP_STORED)
+            _ZIP.writestr(name, png)
+        except Exception as e:
+            # Keep draining the queue (e.g. read-only cwd, disk full) so screenshot_archive's
+            # join() can still return at session teardown
+            print(f"Could not save screenshot {name}: {e!r}", file=sys.stderr)
+        finally:
+            _SCREENSHOT_QUEUE.task_done()
+
+
+threading.Thread(target=_screenshot_writer, name="screenshot-writer", daemon=True).start()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def screenshot_archive():
+    yield
+    _SCREENSHOT_QUEUE.join()  # flush pending screenshots before closing the archive
+    if _ZIP is not None:
+        _ZIP.close()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    rep = outcome.get_result()
+    if rep.failed and call.when == "call":
+        driver = item.funcargs.get("driver")
+        if driver is not None:
+            timestamp = int(time.time() * 1000)
+            screenshot_file = f"{item.name}_{timestamp}.png"
+            try:
+                png = driver.get_screenshot_as_png()
+            except WebDriverException as e:
+                # e.g. the test failed because Chrome crashed; don't turn that into an INTERNALERROR
+                rep.sections.append(("screenshot", f"screenshot unavailable: {e.msg or e!r}"))
+                return
+            _SCREENSHOT_QUEUE.put((screenshot_file, png))
+            rep.sections.append(
+                ("screenshot", f"Screenshot saved to screenshots_{os.getpid()}.zip:{screenshot_file}")
+            )
@@ -7,16 +7,22 @@ This test suite verifies basic page functionality and content, including:
 - Page title verification
 - Login verification
 - Page navigation and interaction with elements such as links
-- Saves screenshot of every test stage for audit and traceability purposes.
+- Saves a screenshot of every failing test for debugging (see conftest.py).
 
 Requirements:
 - Python 3.x
 - Selenium
 - pytest
 - webdriver_manager
+- pytest-xdist (optional, for parallel runs)
 
 The tests are designed to be run with Chrome, using ChromeDriverManager to manage the driver.
-Some `time.sleep()` calls are used for demo purposes to allow visual confirmation during test runs.
+They can be run in parallel with pytest-xdist (`pytest -n auto test_saucedemo.py`); every worker
+launches its own incognito Chrome, and failure screenshots go to a per-process
+`screenshots_<pid>.zip` archive so workers do not collide. Within a process a single Chrome
+session is shared by all tests and reset (cookies cleared, `about:blank` loaded) between them.
+Chrome runs headless unless the `HEADLESS=0` environment variable is set.
+Page readiness is detected with explicit `WebDriverWait` conditions rather than fixed `time.sleep()` pauses.
 """
 
 from xml.dom.xmlbuilder import Options
@@ -28,74 +34,205 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import tempfile, shutil, os
-import json
-
-
-
-@pytest.fixture
-def driver():
-    service = Service(ChromeDriverManager().install())
-    options = webdriver.ChromeOptions()
-
+from selenium.common.exceptions import TimeoutException, WebDriverException
+import os
+
+
+# Locators shared by the tests
+LOGIN_BTN = (By.ID, "login-button")
+USER_FIELD = (By.ID, "user-name")
+PW_FIELD = (By.ID, "password")
+ERROR_MSG = (By.CSS_SELECTOR, "[data-test='error']")
+PAGE_TITLE = (By.CLASS_NAME, "title")
+BURGER = (By.ID, "react-burger-menu-btn")
+ABOUT_LINK = (By.ID, "about_sidebar_link")
+
+# ChromeDriverManager().install() stats its cache (and may hit the network) on every call,
+# so resolve the driver path once, at import time, in each pytest process.
+_CHROMEDRIVER_PATH = ChromeDriverManager().install()
+
+# Chrome runs headless by default; set HEADLESS=0 to watch the browser while debugging.
+HEADLESS = os.environ.get("HEADLESS", "1") != "0"
+
+# Resources the browser never downloads during the tests
+_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.svg", "*.woff*",
+    "*google-analytics*", "*googletagmanager*",
+]
+
+# Chrome command-line switches, built once and applied by _make_options()
+_BASE_OPTIONS_ARGS = [
     # 1) Hard-disable PW manager & leak detection via flags/prefs
-    options.add_argument("--disable-save-password-bubble")
-    options.add_argument("--disable-features=PasswordManagerOnboarding,PasswordLeakDetection,AutofillKeychain,AutofillServerCommunication")
-    options.add_experimental_option("prefs", {
-        "credentials_enable_service": False,
-        "profile.password_manager_enabled": False,
-        "credentials_enable_autosignin": False,
-        "autofill.profile_enabled": False,
-        "autofill.credit_card_enabled": False,
-        "safebrowsing.enabled": False  # test only
-    })
+    "--disable-save-password-bubble",
+    "--disable-features=PasswordManagerOnboarding,PasswordLeakDetection,AutofillKeychain,AutofillServerCommunication",
+    # 2) Extra isolation that often kills the bubble entirely
+    "--incognito",  # PW manager is off in incognito (or "--guest", even stricter, if needed)
+    # your original zoom arg
+    "--force-device-scale-factor=0.5",
+    # 3) A fixed size keeps layouts and screenshots stable; it is set at startup,
+    # so no maximize_window() round-trip is needed
+    "--window-size=1920,1080",
+]
+if HEADLESS:
+    # Headless skips window/compositor setup
+    _BASE_OPTIONS_ARGS += ["--headless=new", "--disable-gpu"]
+else:
+    _BASE_OPTIONS_ARGS.append("--start-maximized")
+
+_CHROME_PREFS = {
+    "credentials_enable_service": False,
+    "profile.password_manager_enabled": False,
+    "credentials_enable_autosignin": False,
+    "autofill.profile_enabled": False,
+    "autofill.credit_card_enabled": False,
+    "safebrowsing.enabled": False  # test only
+}
+
+
+def _make_options():
+    """Return a fresh ChromeOptions configured with the shared arguments and prefs."""
+    options = webdriver.ChromeOptions()
+    for arg in _BASE_OPTIONS_ARGS:
+        options.add_argument(arg)
+    options.add_experimental_option("prefs", _CHROME_PREFS)
     # reduce Chrome automation noise
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
+    # Return from driver.get() at DOMContentLoaded; the tests wait explicitly for the elements they use
+    options.page_load_strategy = "eager"
+    return options
 
-    # 2) Create a fresh profile and pre-write the Preferences file
-    temp_profile = tempfile.mkdtemp(prefix="chrome-prof-")
-    default_dir = os.path.join(temp_profile, "Default")
-    os.makedirs(default_dir, exist_ok=True)
-
-    # Preseed Preferences so Chrome starts with these disabled
-    prefs_path = os.path.join(default_dir, "Preferences")
-    prefs_json = {
-        "credentials_enable_service": False,
-        "profile": {
-            "password_manager_enabled": False
-        },
-        "autofill": {
-            "enabled": False
-        },
-        "safebrowsing": {
-            "enabled": False
-        },
-        # This can help prevent Google account interstitials in some envs
-        "signin": {
-            "allowed": False
-        }
-    }
-    with open(prefs_path, "w", encoding="utf-8") as f:
-        json.dump(prefs_json, f)
-
-    options.add_argument(f"--user-data-dir={temp_profile}")
-    options.add_argument("--profile-directory=Default")
-
-    # 3) Extra isolation that often kills the bubble entirely
-    options.add_argument("--incognito")   # PW manager is off in incognito
-    # OR: options.add_argument("--guest") # even stricter, try this if needed
 
-    # your original zoom arg
-    options.add_argument("--force-device-scale-factor=0.5")
+@pytest.fixture(scope="session")  # one Chrome per pytest process (per worker under xdist)
+def driver():
+    service = Service(_CHROMEDRIVER_PATH)
+    options = _make_options()
 
     driver = webdriver.Chrome(service=service, options=options)
-    driver.maximize_window()
+
+    # Rely on explicit waits only: a non-zero implicit wait would stall every find_element
+    # made inside an expected condition and multiply WebDriverWait's poll interval
+    driver.implicitly_wait(0)
+
+    # Keep Chrome's HTTP cache on so later tests reuse the assets fetched by the first one
+    # (the session is shared and `reset` only clears cookies)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+
+    # The tests only check titles, texts and URLs, so skip images, fonts and analytics
+    # (screenshots will show the pages without them)
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_URLS})
     try:
         yield driver
     finally:
         driver.quit()
-        shutil.rmtree(temp_profile, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def reset(driver):
+    """
+    Return the shared browser to a clean state after every test.
+
+    Cookies are cleared for all origins (not only the page currently open), so a login
+    performed by one test never leaks into the next.
+    """
+    yield
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.get("about:blank")
+
+
+# JS helper shared by the scripts below. SauceDemo is a React app, so values go through the
+# native input setter and an `input` event; a plain `.value = ...` assignment would be
+# ignored by React's controlled inputs.
+_SET_VALUE_JS = """
+function setValue(field, value) {
+    Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set.call(field, value);
+    field.dispatchEvent(new Event('input', {bubbles: true}));
+}
+"""
+
+# Fills both credential fields and submits in a single WebDriver round-trip.
+_LOGIN_SCRIPT = _SET_VALUE_JS + """
+setValue(document.getElementById('user-name'), arguments[0]);
+setValue(document.getElementById('password'), arguments[1]);
+document.getElementById('login-button').click();
+"""
+
+
+def login(driver, user, pw):
+    """
+    Open the Swag Labs login page and submit the given credentials.
+
+    Args:
+        driver (webdriver.Chrome): Selenium WebDriver fixture.
+        user (str): Username to enter.
+        pw (str): Password to enter.
+    """
+    driver.get("https://www.saucedemo.com/")
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located(LOGIN_BTN)
+    )
+    driver.execute_script(_LOGIN_SCRIPT, user, pw)
+
+
+# Same React-safe value assignment as _LOGIN_SCRIPT, for a single element.
+_SET_VALUE_SCRIPT = _SET_VALUE_JS + """
+setValue(arguments[0], arguments[1]);
+"""
+
+
+def set_input_value(driver, element, value):
+    """
+    Set an input's value with one script call instead of send_keys' synthesized keystrokes.
+
+    Args:
+        driver (webdriver.Chrome): Selenium WebDriver fixture.
+        element (WebElement): Input element to fill.
+        value (str): Text to put in the field.
+    """
+    driver.execute_script(_SET_VALUE_SCRIPT, element, value)
+
+
+# Resolves inside the page as soon as location.href contains arguments[0], or with false
+# after arguments[1] ms, so the whole wait costs a single WebDriver round-trip.
+_WAIT_FOR_URL_SCRIPT = """
+const [fragment, timeoutMs, done] = arguments;
+const deadline = Date.now() + timeoutMs;
+(function check() {
+    if (window.location.href.includes(fragment)) return done(true);
+    if (Date.now() >= deadline) return done(false);
+    setTimeout(check, 50);
+})();
+"""
+
+
+def wait_for_url(driver, fragment, timeout=10):
+    """
+    Wait until the current URL contains `fragment`.
+
+    The URL is watched from inside the page with one async script call. If the document is
+    replaced while waiting (a full navigation), this falls back to polling `driver.current_url`
+    every 100 ms for the rest of `timeout`.
+
+    Args:
+        driver (webdriver.Chrome): Selenium WebDriver fixture.
+        fragment (str): Text the URL must contain.
+        timeout (float): Seconds to wait before raising TimeoutException.
+    """
+    deadline = time.monotonic() + timeout
+    try:
+        found = driver.execute_async_script(_WAIT_FOR_URL_SCRIPT, fragment, int(timeout * 1000))
+    except WebDriverException:
+        pass  # document unloaded mid-wait (or the script timeout hit); poll below instead
+    else:
+        if found:
+            return
+        raise TimeoutException(f"URL did not contain '{fragment}' within {timeout}s: {driver.current_url}")
+    # Only poll for whatever is left of `timeout`
+    remaining = max(deadline - time.monotonic(), 0)
+    WebDriverWait(driver, remaining, poll_frequency=0.1).until(
+        EC.url_contains(fragment)
+    )
 
 
 # @pytest.mark.skip(reason="Skipping this test for demo")  # comment to enable the test
@@ -105,9 +242,8 @@ def test_Swag_lab_title(driver):
 
     Steps:
     1. Open the Swag Labs homepage.
-    2. Optionally wait to visually confirm the page load.
+    2. Wait for the login form to be rendered.
     3. Assert that the page title matches the expected string.
-    4. Take a screenshot of the page.
 
     Args:
         driver (webdriver.Chrome): Selenium WebDriver fixture.
@@ -115,16 +251,11 @@ def test_Swag_lab_title(driver):
     print("Checking for correct page title")
     
     driver.get("https://www.saucedemo.com/")
-    time.sleep(2)  # not required, but pause so you can see the page
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located(LOGIN_BTN)
+    )
     
     assert "Swag Labs" in driver.title # use the Selenium's built-in property
-        
-    timestamp = int(time.time())
-    screenshot_file = f"screenshot_{timestamp}.png"
-    driver.save_screenshot(screenshot_file) # take a screenshot to verify how the home page looked like
-    print(f"Screenshot saved to {screenshot_file}")
-
-    time.sleep(2)  # not required, but pause so you can see the page
 
 
 
@@ -137,7 +268,6 @@ def test_login_without_credentials(driver):
     1. Open the Swag Labs homepage
     2. Click the login button without entering credentials
     3. Verify error message appears with correct text
-    4. Take a screenshot of the error message
     
     Args:
         driver (webdriver.Chrome): Selenium WebDriver fixture.
@@ -149,13 +279,13 @@ def test_login_without_credentials(driver):
     
     # Wait for login button to be clickable and click it
     login_button = WebDriverWait(driver, 10).until(
-        EC.element_to_be_clickable((By.ID, "login-button"))
+        EC.element_to_be_clickable(LOGIN_BTN)
     )
     login_button.click()
     
     # Wait for error message to appear
     error_message = WebDriverWait(driver, 10).until(
-        EC.visibility_of_element_located((By.CSS_SELECTOR, "[data-test='error']"))
+        EC.visibility_of_element_located(ERROR_MSG)
     )
     
     # Verify the error message text
@@ -165,13 +295,6 @@ def test_login_without_credentials(driver):
     
     print(f"✓ Error message displayed correctly: {error_message.text}")
 
-    timestamp = int(time.time())
-    screenshot_file = f"screenshot_{timestamp}.png"
-    driver.save_screenshot(screenshot_file) # take a screenshot to verify the error message with no credentials
-    print(f"Screenshot saved to {screenshot_file}")
-    
-    time.sleep(2)  # Optional: pause to visually verify
-
 
 # @pytest.mark.skip(reason="Skipping this test for demo")  # comment to enable the test
 def test_login_with_wrong_credentials(driver):
@@ -183,7 +306,6 @@ def test_login_with_wrong_credentials(driver):
     2. Enter invalid username and password
     3. Click the login button
     4. Verify error message appears with correct text
-    5. Take a screenshot of the error message
     
     Args:
         driver (webdriver.Chrome): Selenium WebDriver fixture.
@@ -193,21 +315,27 @@ def test_login_with_wrong_credentials(driver):
     # Navigate to the page
     driver.get("https://www.saucedemo.com/")
     
-    # Enter invalid username
-    username_field = driver.find_element(By.ID, "user-name")
-    username_field.send_keys("kingsley")
+    # Enter invalid username once the login form is rendered
+    username_field = WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located(USER_FIELD)
+    )
+    set_input_value(driver, username_field, "kingsley")
     
     # Enter invalid password
-    password_field = driver.find_element(By.ID, "password")
-    password_field.send_keys("djdskjsfhfak")
+    password_field = WebDriverWait(driver, 10).until(
+        EC.element_to_be_clickable(PW_FIELD)
+    )
+    set_input_value(driver, password_field, "djdskjsfhfak")
     
     # Click login button
-    login_button = driver.find_element(By.ID, "login-button")
+    login_button = WebDriverWait(driver, 10).until(
+        EC.element_to_be_clickable(LOGIN_BTN)
+    )
     login_button.click()
     
     # Wait for error message to appear
     error_message = WebDriverWait(driver, 10).until(
-        EC.visibility_of_element_located((By.CSS_SELECTOR, "[data-test='error']"))
+        EC.visibility_of_element_located(ERROR_MSG)
     )
     
     # Verify the error message text
@@ -216,13 +344,6 @@ def test_login_with_wrong_credentials(driver):
         f"Expected error: '{expected_error}', but got: '{error_message.text}'"
     
     print(f"✓ Error message displayed correctly: {error_message.text}")
-    
-    timestamp = int(time.time())
-    screenshot_file = f"screenshot_{timestamp}.png"
-    driver.save_screenshot(screenshot_file) # take a screenshot to verify the error message with wrong credentials
-    print(f"Screenshot saved to {screenshot_file}")
-
-    time.sleep(5)  # Optional: pause to visually verify
 
 
 
@@ -236,32 +357,17 @@ def test_login_with_valid_credentials(driver):
     2. Enter valid username and password
     3. Click the login button
     4. Verify successful login by checking the inventory page URL and title
-    5. Take a screenshot of the inventory page
     
     Args:
         driver (webdriver.Chrome): Selenium WebDriver fixture.
     """
     print("Testing login with valid credentials")
     
-    # Navigate to the page
-    driver.get("https://www.saucedemo.com/")
-    
-    # Enter valid username
-    username_field = driver.find_element(By.ID, "user-name")
-    username_field.send_keys("standard_user")
-    
-    # Enter valid password
-    password_field = driver.find_element(By.ID, "password")
-    password_field.send_keys("secret_sauce")
-    
-    # Click login button
-    login_button = driver.find_element(By.ID, "login-button")
-    login_button.click()
+    # Open the page, enter valid username and password, and click login
+    login(driver, "standard_user", "secret_sauce")
     
     # Wait for the inventory page to load
-    WebDriverWait(driver, 10).until(
-        EC.url_contains("inventory.html")
-    )
+    wait_for_url(driver, "inventory.html")
     
     # Verify we're on the inventory page
     assert "inventory.html" in driver.current_url, \
@@ -272,20 +378,13 @@ def test_login_with_valid_credentials(driver):
     
     # Verify the products page header is visible
     page_title = WebDriverWait(driver, 10).until(
-        EC.visibility_of_element_located((By.CLASS_NAME, "title"))
+        EC.visibility_of_element_located(PAGE_TITLE)
     )
     assert page_title.text == "Products", \
         f"Expected page title 'Products', but got: '{page_title.text}'"
     
     print(f"✓ Successfully logged in! Current URL: {driver.current_url}")
     print(f"✓ Page title: {page_title.text}")
-    
-    timestamp = int(time.time())
-    screenshot_file = f"screenshot_{timestamp}.png"
-    driver.save_screenshot(screenshot_file) # take a screenshot to confirm the login was successful
-    print(f"Screenshot saved to {screenshot_file}")
-
-    time.sleep(2)  # Optional: pause to visually verify
 
 
 # @pytest.mark.skip(reason="Skipping this test for demo")  # comment to enable the test
@@ -294,69 +393,51 @@ def test_navigate_to_about_after_login(driver):
     Test navigation to About page after successful login.
     
     Steps:
-    1. Login with valid credentials
-    2. Wait for inventory page to load
+    1. Start a logged-in session by seeding SauceDemo's session cookie (the login form
+       itself is covered by test_login_with_valid_credentials)
+    2. Open the inventory page
     3. Click hamburger menu (3 horizontal lines in top-left)
     4. Click "About" from the menu
     5. Verify navigation to Sauce Labs About page
-    6. Take a screenshot of the About page
     
     Args:
         driver (webdriver.Chrome): Selenium WebDriver fixture.
     """
     print("\n=== Testing Navigation to About Page ===")
     
-    # Step 1: Navigate to login page
+    # Step 1: SauceDemo keeps the logged-in user in the `session-username` cookie, so set it
+    # directly instead of filling in and submitting the login form
     driver.get("https://www.saucedemo.com/")
-    print("✓ Opened Swag Labs login page")
-    
-    # Step 2: Enter credentials and login
-    username_field = WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.ID, "user-name"))
-    )
-    username_field.send_keys("standard_user")
-    print("✓ Entered username")
-    
-    password_field = driver.find_element(By.ID, "password")
-    password_field.send_keys("secret_sauce")
-    print("✓ Entered password")
+    driver.add_cookie({"name": "session-username", "value": "standard_user"})
+    print("✓ Seeded session for standard_user")
     
-    login_button = driver.find_element(By.ID, "login-button")
-    login_button.click()
-    print("✓ Clicked login button")
-    
-    # Step 3: Wait for successful login (inventory page loads)
-    WebDriverWait(driver, 10).until(
-        EC.url_contains("inventory.html")
-    )
-    print("✓ Successfully logged in - on inventory page")
-    
-    # Wait a moment for page to fully load
-    time.sleep(1)
+    # Step 2: Open the inventory page
+    driver.get("https://www.saucedemo.com/inventory.html")
+    print("✓ Opened inventory page")
     
-    # Step 4: Click the hamburger menu (3 lines in top-left corner)
+    # Step 3: Click the hamburger menu (3 lines in top-left corner)
     hamburger_menu = WebDriverWait(driver, 10).until(
-        EC.element_to_be_clickable((By.ID, "react-burger-menu-btn"))
+        EC.element_to_be_clickable(BURGER)
     )
     hamburger_menu.click()
     print("✓ Clicked hamburger menu (☰)")
     
-    # Wait for menu animation to complete
-    time.sleep(1)
+    # Wait for the menu to slide in
+    WebDriverWait(driver, 10).until(
+        EC.visibility_of_element_located(ABOUT_LINK)
+    )
     
-    # Step 5: Click "About" link from the menu
+    # Step 4: Click "About" link from the menu
     about_link = WebDriverWait(driver, 10).until(
-        EC.element_to_be_clickable((By.ID, "about_sidebar_link"))
+        EC.element_to_be_clickable(ABOUT_LINK)
     )
     about_link.click()
     print("✓ Clicked 'About' link")
     
-    # Step 6: Wait for navigation to Sauce Labs website
-    WebDriverWait(driver, 10).until(
-        EC.url_contains("saucelabs.com")
-    )
+    # Step 5: Wait for navigation to Sauce Labs website
+    wait_for_url(driver, "saucelabs.com")
     
-    # Step 7: Verify we're on the About page
+    # ...and verify we're on the About page
     current_url = driver.current_url
     assert "saucelabs.com" in current_url, \
         f"Expected URL to contain 'saucelabs.com', but got: {current_url}"
@@ -364,14 +445,5 @@ def test_navigate_to_about_after_login(driver):
     print(f"✓ Successfully navigated to About page!")
     print(f"  Current URL: {current_url}")
     
-    # Pause to see the result
-    time.sleep(3)
-    timestamp = int(time.time())
-    screenshot_file = f"screenshot_{timestamp}.png"
-    driver.save_screenshot(screenshot_file) # take a screenshot to verify how the about page looked like
-    print(f"Screenshot saved to {screenshot_file}")
-    
-    time.sleep(2)
-    
     print("=== Test Completed Successfully ===\n")
 